@@ -1,13 +1,70 @@
+import bisect
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 from models import (
     APPRValidationRequest, 
-    CompensationResult, 
+    CompensationOutcome, 
     DisruptionType, 
     DisruptionCategory,
     PassengerType
 )
-from canadian_airports import is_canadian_airport
+from canadian_airports import is_canadian_airport_raw
+
+# Large carrier compensation rates (CAD)
+_COMP_3_6 = 400.0
+_COMP_6_9 = 700.0
+_COMP_9_PLUS = 1000.0
+_COMP_DB_DOM = 900.0
+_COMP_DB_INT = 1800.0
+_COMP_DB_INT_LONG = 2400.0
+
+# Delay compensation buckets: under 3h, 3-6h, 6-9h, 9h+
+_DELAY_THRESHOLDS = (3, 6, 9)
+_DELAY_AMOUNTS = (0.0, _COMP_3_6, _COMP_6_9, _COMP_9_PLUS)
+
+# Care obligations accumulate at 2h, 3h and 8h of delay
+_CARE_THRESHOLDS = (2, 3, 8)
+_CARE_2H = ("Communication: Provide updates on delay status and passenger rights",)
+_CARE_3H = _CARE_2H + ("Food and drink: Provide meals and refreshments",)
+_CARE_8H = _CARE_3H + (
+    "Accommodation: Provide overnight accommodation if required",
+    "Transportation: Provide transport between airport and accommodation",
+)
+_CARE_BUCKETS = ((), _CARE_2H, _CARE_3H, _CARE_8H)
+
+# Disruption type -> (rebooking rights, refund rights)
+_DELAY_CANCELLATION_RIGHTS = (
+    ("Right to rebooking on next available flight at no additional cost",),
+    ("Right to refund if passenger chooses not to travel",),
+)
+_REBOOKING_REFUND_RIGHTS = {
+    DisruptionType.DELAY: _DELAY_CANCELLATION_RIGHTS,
+    DisruptionType.CANCELLATION: _DELAY_CANCELLATION_RIGHTS,
+    DisruptionType.DENIED_BOARDING: (
+        ("Right to alternative flight or rebooking",),
+        ("Right to full refund if alternative not acceptable",),
+    ),
+}
+
+# Passenger types that trigger enhanced protections
+_MINOR_TYPES = frozenset({PassengerType.MINOR})
+_DISABILITY_TYPES = frozenset({PassengerType.DISABILITY})
+
+
+def _compute_delay_compensation(delay_hours: float, category: DisruptionCategory, label: str) -> Tuple[bool, float, Optional[str]]:
+    """
+    Apply the carrier-control rules shared by delays and cancellations.
+    
+    Returns:
+        Tuple of (eligible, compensation_amount, note); note is set only when not eligible
+    """
+    if category == DisruptionCategory.WITHIN_CARRIER_CONTROL:
+        return True, _DELAY_AMOUNTS[bisect.bisect_right(_DELAY_THRESHOLDS, delay_hours)], None
+    
+    if category == DisruptionCategory.WITHIN_CARRIER_CONTROL_SAFETY:
+        return False, 0.0, f"{label} within carrier control but required for safety - no monetary compensation required"
+    
+    return False, 0.0, f"{label} outside carrier control - no monetary compensation required"
 
 
 class APPRValidator:
@@ -16,19 +73,22 @@ class APPRValidator:
     Handles Canadian passenger rights regulations compliance.
     """
     
+    # Stateless: handlers are static and share one set of module constants
+    __slots__ = ()
+    
+    carrier_type = "large"
+    
+    # Rate table for display (/appr-info); handlers use the module constants
     LARGE_CARRIER_COMPENSATION = {
-        "3_to_6_hours": 400.0,
-        "6_to_9_hours": 700.0,
-        "9_plus_hours": 1000.0,
-        "denied_boarding_domestic": 900.0,
-        "denied_boarding_international": 1800.0,
-        "denied_boarding_international_long": 2400.0
+        "3_to_6_hours": _COMP_3_6,
+        "6_to_9_hours": _COMP_6_9,
+        "9_plus_hours": _COMP_9_PLUS,
+        "denied_boarding_domestic": _COMP_DB_DOM,
+        "denied_boarding_international": _COMP_DB_INT,
+        "denied_boarding_international_long": _COMP_DB_INT_LONG
     }
     
-    def __init__(self):
-        self.carrier_type = "large"
-    
-    def validate_appr_request(self, request: APPRValidationRequest) -> Tuple[bool, str, CompensationResult]:
+    def validate_appr_request(self, request: APPRValidationRequest) -> Tuple[bool, str, CompensationOutcome]:
         """
         Main validation method that determines APPR applicability and compensation.
         
@@ -36,8 +96,9 @@ class APPRValidator:
             Tuple of (is_appr_applicable, reason, compensation_result)
         """
         # Check if APPR applies (flight must depart from Canada)
-        if not is_canadian_airport(request.flight_info.departure_airport):
-            return False, f"APPR does not apply - flight departs from {request.flight_info.departure_airport} (non-Canadian airport)", CompensationResult(eligible_for_compensation=False)
+        # FlightInfo already uppercases airport codes, so the raw lookup is safe
+        if not is_canadian_airport_raw(request.flight_info.departure_airport):
+            return False, f"APPR does not apply - flight departs from {request.flight_info.departure_airport} (non-Canadian airport)", CompensationOutcome(eligible_for_compensation=False)
         
         # APPR applies - now determine compensation and rights
         appr_reason = f"APPR applies - flight departs from Canadian airport {request.flight_info.departure_airport}"
@@ -46,150 +107,125 @@ class APPRValidator:
         
         return True, appr_reason, compensation_result
     
-    def _calculate_compensation_and_rights(self, request: APPRValidationRequest) -> CompensationResult:
+    def validate_many(self, requests: Sequence[APPRValidationRequest]) -> List[Tuple[bool, str, CompensationOutcome]]:
+        """
+        Validate a batch of requests in one call.
+        
+        Returns:
+            List of (is_appr_applicable, reason, compensation_result) tuples, in request order
+        """
+        validate = self.validate_appr_request
+        return [validate(request) for request in requests]
+    
+    @staticmethod
+    def _calculate_compensation_and_rights(request: APPRValidationRequest) -> CompensationOutcome:
         """Calculate compensation amount and passenger rights based on disruption details."""
         
-        result = CompensationResult(eligible_for_compensation=False)
+        result = CompensationOutcome(eligible_for_compensation=False)
         
         disruption = request.disruption_event
         flight = request.flight_info
         passenger = request.passenger_info
         
         # Handle different disruption types
-        if disruption.disruption_type == DisruptionType.DELAY:
-            result = self._handle_delay(request)
-        elif disruption.disruption_type == DisruptionType.CANCELLATION:
-            result = self._handle_cancellation(request)
-        elif disruption.disruption_type == DisruptionType.DENIED_BOARDING:
-            result = self._handle_denied_boarding(request)
-        elif disruption.disruption_type == DisruptionType.TARMAC_DELAY:
-            result = self._handle_tarmac_delay(request)
-        elif disruption.disruption_type == DisruptionType.DOWNGRADE:
-            result = self._handle_downgrade(request)
-        elif disruption.disruption_type == DisruptionType.BAGGAGE_ISSUE:
-            result = self._handle_baggage_issue(request)
+        handler = APPRValidator._DISRUPTION_HANDLERS.get(disruption.disruption_type)
+        if handler is not None:
+            handler(request, result)
         
         # Add care obligations based on delay duration
-        self._add_care_obligations(request, result)
+        APPRValidator._add_care_obligations(request, result)
         
         # Add rebooking and refund rights
-        self._add_rebooking_refund_rights(request, result)
+        APPRValidator._add_rebooking_refund_rights(request, result)
         
         # Add special passenger considerations
-        self._add_special_passenger_rights(request, result)
+        APPRValidator._add_special_passenger_rights(request, result)
         
         return result
     
-    def _handle_delay(self, request: APPRValidationRequest) -> CompensationResult:
+    @staticmethod
+    def _handle_delay(request: APPRValidationRequest, result: CompensationOutcome):
         """Handle flight delays."""
-        result = CompensationResult(eligible_for_compensation=False)
         disruption = request.disruption_event
         
         if not disruption.delay_duration_hours:
             result.compliance_notes.append("Delay duration not specified")
-            return result
+            return
         
         delay_hours = disruption.delay_duration_hours
         
         # No compensation for delays under 3 hours
         if delay_hours < 3:
             result.compliance_notes.append(f"Delay of {delay_hours} hours is under 3-hour threshold - no compensation required")
-            return result
+            return
         
         # Check disruption category
-        if disruption.disruption_category == DisruptionCategory.OUTSIDE_CARRIER_CONTROL:
-            result.compliance_notes.append("Delay outside carrier control - no monetary compensation required")
-            return result
-        
-        if disruption.disruption_category == DisruptionCategory.WITHIN_CARRIER_CONTROL_SAFETY:
-            result.compliance_notes.append("Delay within carrier control but required for safety - no monetary compensation required")
-            return result
+        eligible, amount, note = _compute_delay_compensation(delay_hours, disruption.disruption_category, "Delay")
+        if note is not None:
+            result.compliance_notes.append(note)
+            return
         
         # Within carrier control - full compensation
-        if disruption.disruption_category == DisruptionCategory.WITHIN_CARRIER_CONTROL:
-            result.eligible_for_compensation = True
-            
-            if 3 <= delay_hours < 6:
-                result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["3_to_6_hours"]
-            elif 6 <= delay_hours < 9:
-                result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["6_to_9_hours"]
-            else:  # 9+ hours
-                result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["9_plus_hours"]
-            
-            result.compliance_notes.append(f"Delay of {delay_hours} hours within carrier control - compensation required")
-        
-        return result
+        result.eligible_for_compensation = True
+        result.compensation_amount = amount
+        result.compliance_notes.append(f"Delay of {delay_hours} hours within carrier control - compensation required")
     
-    def _handle_cancellation(self, request: APPRValidationRequest) -> CompensationResult:
+    @staticmethod
+    def _handle_cancellation(request: APPRValidationRequest, result: CompensationOutcome):
         """Handle flight cancellations."""
-        result = CompensationResult(eligible_for_compensation=False)
         disruption = request.disruption_event
         
         # Check if 14-day advance notice was given
         if disruption.cancellation_notice_days and disruption.cancellation_notice_days >= 14:
             result.compliance_notes.append("Cancellation with 14+ days notice - no compensation required")
-            return result
+            return
         
-        # Same logic as delays for compensation categories
-        if disruption.disruption_category == DisruptionCategory.OUTSIDE_CARRIER_CONTROL:
-            result.compliance_notes.append("Cancellation outside carrier control - no monetary compensation required")
-            return result
+        # Use delay_duration_hours to represent delay to alternative flight
+        delay_hours = disruption.delay_duration_hours or 0
         
-        if disruption.disruption_category == DisruptionCategory.WITHIN_CARRIER_CONTROL_SAFETY:
-            result.compliance_notes.append("Cancellation within carrier control but required for safety - no monetary compensation required")
-            return result
+        # Same logic as delays for compensation categories
+        eligible, amount, note = _compute_delay_compensation(delay_hours, disruption.disruption_category, "Cancellation")
+        if note is not None:
+            result.compliance_notes.append(note)
+            return
         
         # Within carrier control - compensation based on delay to alternative flight
-        if disruption.disruption_category == DisruptionCategory.WITHIN_CARRIER_CONTROL:
-            result.eligible_for_compensation = True
-            
-            # Use delay_duration_hours to represent delay to alternative flight
-            delay_hours = disruption.delay_duration_hours or 0
-            
-            if delay_hours < 3:
-                result.compensation_amount = 0
-                result.compliance_notes.append("Alternative flight within 3 hours - no compensation required")
-            elif 3 <= delay_hours < 6:
-                result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["3_to_6_hours"]
-            elif 6 <= delay_hours < 9:
-                result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["6_to_9_hours"]
-            else:  # 9+ hours
-                result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["9_plus_hours"]
-            
-            result.compliance_notes.append(f"Cancellation within carrier control - compensation based on {delay_hours} hour delay to alternative flight")
+        result.eligible_for_compensation = True
+        result.compensation_amount = amount
+        if delay_hours < 3:
+            result.compliance_notes.append("Alternative flight within 3 hours - no compensation required")
         
-        return result
+        result.compliance_notes.append(f"Cancellation within carrier control - compensation based on {delay_hours} hour delay to alternative flight")
     
-    def _handle_denied_boarding(self, request: APPRValidationRequest) -> CompensationResult:
+    @staticmethod
+    def _handle_denied_boarding(request: APPRValidationRequest, result: CompensationOutcome):
         """Handle denied boarding situations."""
-        result = CompensationResult(eligible_for_compensation=True)
+        result.eligible_for_compensation = True
         flight = request.flight_info
         
         # Determine if international flight
-        is_international = not (is_canadian_airport(flight.departure_airport) and 
-                               is_canadian_airport(flight.arrival_airport))
+        # Departure is already known to be Canadian (checked in validate_appr_request)
+        is_international = not is_canadian_airport_raw(flight.arrival_airport)
         
         if not is_international:
             # Domestic flight
-            result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["denied_boarding_domestic"]
+            result.compensation_amount = _COMP_DB_DOM
             result.compliance_notes.append("Denied boarding on domestic flight")
         else:
             # International flight - check distance/duration
             # For simplicity, using higher amount for all international flights
             # In production, would calculate actual distance
-            result.compensation_amount = self.LARGE_CARRIER_COMPENSATION["denied_boarding_international_long"]
+            result.compensation_amount = _COMP_DB_INT_LONG
             result.compliance_notes.append("Denied boarding on international flight")
-        
-        return result
     
-    def _handle_tarmac_delay(self, request: APPRValidationRequest) -> CompensationResult:
+    @staticmethod
+    def _handle_tarmac_delay(request: APPRValidationRequest, result: CompensationOutcome):
         """Handle tarmac delays."""
-        result = CompensationResult(eligible_for_compensation=False)
         disruption = request.disruption_event
         
         if not disruption.tarmac_delay_hours:
             result.compliance_notes.append("Tarmac delay duration not specified")
-            return result
+            return
         
         tarmac_hours = disruption.tarmac_delay_hours
         
@@ -200,16 +236,12 @@ class APPRValidator:
         
         # Regular delay compensation rules also apply
         if disruption.delay_duration_hours:
-            delay_result = self._handle_delay(request)
-            result.eligible_for_compensation = delay_result.eligible_for_compensation
-            result.compensation_amount = delay_result.compensation_amount
-            result.compliance_notes.extend(delay_result.compliance_notes)
-        
-        return result
+            APPRValidator._handle_delay(request, result)
     
-    def _handle_downgrade(self, request: APPRValidationRequest) -> CompensationResult:
+    @staticmethod
+    def _handle_downgrade(request: APPRValidationRequest, result: CompensationOutcome):
         """Handle service downgrades."""
-        result = CompensationResult(eligible_for_compensation=True)
+        result.eligible_for_compensation = True
         passenger = request.passenger_info
         
         # Calculate refund based on ticket price difference
@@ -220,56 +252,52 @@ class APPRValidator:
             result.compensation_amount = passenger.ticket_price * 0.50  # 50% refund for economy downgrades
         
         result.compliance_notes.append(f"Service downgrade from {passenger.booking_class} class")
-        
-        return result
     
-    def _handle_baggage_issue(self, request: APPRValidationRequest) -> CompensationResult:
+    @staticmethod
+    def _handle_baggage_issue(request: APPRValidationRequest, result: CompensationOutcome):
         """Handle baggage issues."""
-        result = CompensationResult(eligible_for_compensation=False)
-        
         # Baggage issues typically handled under separate regulations
         # But carrier must provide compensation for essential items
         result.compliance_notes.append("Baggage issue - carrier must reimburse reasonable interim expenses")
         result.alternative_arrangements.append("Reimbursement for essential items while baggage is delayed")
-        
-        return result
     
-    def _add_care_obligations(self, request: APPRValidationRequest, result: CompensationResult):
+    # Disruption type -> handler, looked up once per request
+    _DISRUPTION_HANDLERS = {
+        DisruptionType.DELAY: _handle_delay,
+        DisruptionType.CANCELLATION: _handle_cancellation,
+        DisruptionType.DENIED_BOARDING: _handle_denied_boarding,
+        DisruptionType.TARMAC_DELAY: _handle_tarmac_delay,
+        DisruptionType.DOWNGRADE: _handle_downgrade,
+        DisruptionType.BAGGAGE_ISSUE: _handle_baggage_issue,
+    }
+    
+    @staticmethod
+    def _add_care_obligations(request: APPRValidationRequest, result: CompensationOutcome):
         """Add care obligations based on delay duration."""
         disruption = request.disruption_event
         delay_hours = disruption.delay_duration_hours or disruption.tarmac_delay_hours or 0
-        
-        if delay_hours >= 2:
-            result.care_obligations.append("Communication: Provide updates on delay status and passenger rights")
-        
-        if delay_hours >= 3:
-            result.care_obligations.append("Food and drink: Provide meals and refreshments")
-        
-        if delay_hours >= 8:
-            result.care_obligations.append("Accommodation: Provide overnight accommodation if required")
-            result.care_obligations.append("Transportation: Provide transport between airport and accommodation")
+        result.care_obligations.extend(_CARE_BUCKETS[bisect.bisect_right(_CARE_THRESHOLDS, delay_hours)])
     
-    def _add_rebooking_refund_rights(self, request: APPRValidationRequest, result: CompensationResult):
+    @staticmethod
+    def _add_rebooking_refund_rights(request: APPRValidationRequest, result: CompensationOutcome):
         """Add rebooking and refund rights."""
-        disruption = request.disruption_event
-        
-        if disruption.disruption_type in [DisruptionType.DELAY, DisruptionType.CANCELLATION]:
-            result.rebooking_rights.append("Right to rebooking on next available flight at no additional cost")
-            result.refund_rights.append("Right to refund if passenger chooses not to travel")
+        rights = _REBOOKING_REFUND_RIGHTS.get(request.disruption_event.disruption_type)
         
-        if disruption.disruption_type == DisruptionType.DENIED_BOARDING:
-            result.rebooking_rights.append("Right to alternative flight or rebooking")
-            result.refund_rights.append("Right to full refund if alternative not acceptable")
+        if rights is not None:
+            rebooking, refund = rights
+            result.rebooking_rights.extend(rebooking)
+            result.refund_rights.extend(refund)
     
-    def _add_special_passenger_rights(self, request: APPRValidationRequest, result: CompensationResult):
+    @staticmethod
+    def _add_special_passenger_rights(request: APPRValidationRequest, result: CompensationOutcome):
         """Add special considerations for minors and passengers with disabilities."""
         passenger = request.passenger_info
         
-        if passenger.passenger_type == PassengerType.MINOR:
+        if passenger.passenger_type in _MINOR_TYPES:
             result.compliance_notes.append("Minor passenger - enhanced care obligations apply")
             result.care_obligations.append("Special assistance for unaccompanied minors")
         
-        if passenger.has_disability or passenger.passenger_type == PassengerType.DISABILITY:
+        if passenger.has_disability or passenger.passenger_type in _DISABILITY_TYPES:
             result.compliance_notes.append("Passenger with disability - enhanced protections apply")
             result.care_obligations.append("Assistance appropriate to passenger's disability")
             result.alternative_arrangements.append("Priority rebooking for passengers with disabilities")
\ No newline at end of file
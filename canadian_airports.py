@@ -1,4 +1,8 @@
-CANADIAN_AIRPORTS = {
+from types import MappingProxyType
+from typing import Mapping
+
+# Airport names are only needed by the informational endpoints; read-only
+CANADIAN_AIRPORTS: Mapping[str, str] = MappingProxyType({
     # Major International Airports
     'YYZ': 'Toronto Pearson International Airport',
     'YVR': 'Vancouver International Airport',
@@ -50,7 +54,6 @@ CANADIAN_AIRPORTS = {
     
     # Northern and Remote Airports
     'YUX': 'Hall Beach Airport',
-    'YFB': 'Iqaluit Airport',
     'YRT': 'Rankin Inlet Airport',
     'YBK': 'Baker Lake Airport',
     'YGZ': 'Grise Fiord Airport',
@@ -63,12 +66,24 @@ CANADIAN_AIRPORTS = {
     'YHR': 'Happy Valley-Goose Bay Airport',
     'YER': 'Fort Severn Airport',
     'YZS': 'Coral Harbour Airport',
-}
+})
+
+
+# Membership set used on the validation hot path (codes only, no names)
+_CANADIAN_CODES: frozenset[str] = frozenset(CANADIAN_AIRPORTS)
 
 
 def is_canadian_airport(airport_code: str) -> bool:
     """Check if an airport code is a Canadian airport."""
-    return airport_code.upper() in CANADIAN_AIRPORTS
+    # Codes are usually already uppercase: try them as-is before allocating a copy
+    if airport_code in _CANADIAN_CODES:
+        return True
+    return not airport_code.isupper() and airport_code.upper() in _CANADIAN_CODES
+
+
+def is_canadian_airport_raw(code_upper: str) -> bool:
+    """Check an already-uppercase airport code (e.g. one normalized by FlightInfo)."""
+    return code_upper in _CANADIAN_CODES
 
 
 def get_canadian_airport_name(airport_code: str) -> str:
@@ -1,12 +1,15 @@
+import json
 import uuid
 import logging
 from datetime import datetime
+from typing import Any, Dict, List, Tuple
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from models import (
     APPRValidationRequest, 
     APPRValidationResponse,
+    CompensationOutcome,
     CompensationResult
 )
 from appr_validator import APPRValidator
@@ -38,21 +41,38 @@ app.add_middleware(
 # Initialize validator
 validator = APPRValidator()
 
+
+def _new_request_id() -> str:
+    # uuid4 costs a few microseconds against ~1ms per request, so no pooling
+    return str(uuid.uuid4())
+
+
+# Static endpoints are serialized once at import and served as raw bytes
+_STATIC_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
+def _json_bytes(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _static_json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json", headers=_STATIC_HEADERS)
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for logging and error responses."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
             "message": "An unexpected error occurred while processing your request",
-            "request_id": str(uuid.uuid4())
+            "request_id": _new_request_id()
         }
     )
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, Any]:
     """Health check endpoint."""
     return {
         "status": "healthy",
@@ -61,40 +81,56 @@ async def health_check():
         "version": "1.0.0"
     }
 
+# Displayed rates come from the validator's constants so the two cannot drift
+_RATES = APPRValidator.LARGE_CARRIER_COMPENSATION
+
+_APPR_INFO_BYTES = _json_bytes({
+    "appr_coverage": {
+        "applies_to": "Flights departing from Canada",
+        "carrier_classification": "Large Carrier",
+        "disruption_types": [
+            "delays", "cancellations", "denied_boarding", 
+            "tarmac_delays", "downgrades", "baggage_issues"
+        ]
+    },
+    "compensation_structure": {
+        "large_carrier_rates": {
+            "3_to_6_hours": f"CAD ${_RATES['3_to_6_hours']:.0f}",
+            "6_to_9_hours": f"CAD ${_RATES['6_to_9_hours']:.0f}",
+            "9_plus_hours": f"CAD ${_RATES['9_plus_hours']:.0f}",
+            "denied_boarding_domestic": f"CAD ${_RATES['denied_boarding_domestic']:.0f}",
+            "denied_boarding_international": f"CAD ${_RATES['denied_boarding_international']:.0f}-${_RATES['denied_boarding_international_long']:.0f}"
+        }
+    },
+    "disruption_categories": {
+        "within_carrier_control": "Full compensation required",
+        "within_carrier_control_safety": "No monetary compensation, care obligations apply",
+        "outside_carrier_control": "No compensation, limited care obligations"
+    },
+    "care_obligations": {
+        "2_hours": "Communication and updates",
+        "3_hours": "Food and beverages",
+        "8_hours": "Accommodation and transportation"
+    },
+    "canadian_airports_count": len(CANADIAN_AIRPORTS),
+    "tarmac_delay_rule": "Mandatory disembarkation after 4 hours"
+})
+
 @app.get("/appr-info")
-async def get_appr_info():
+async def get_appr_info() -> Response:
     """Get information about APPR regulations and coverage."""
-    return {
-        "appr_coverage": {
-            "applies_to": "Flights departing from Canada",
-            "carrier_classification": "Large Carrier",
-            "disruption_types": [
-                "delays", "cancellations", "denied_boarding", 
-                "tarmac_delays", "downgrades", "baggage_issues"
-            ]
-        },
-        "compensation_structure": {
-            "large_carrier_rates": {
-                "3_to_6_hours": "CAD $400",
-                "6_to_9_hours": "CAD $700",
-                "9_plus_hours": "CAD $1000",
-                "denied_boarding_domestic": "CAD $900",
-                "denied_boarding_international": "CAD $1800-$2400"
-            }
-        },
-        "disruption_categories": {
-            "within_carrier_control": "Full compensation required",
-            "within_carrier_control_safety": "No monetary compensation, care obligations apply",
-            "outside_carrier_control": "No compensation, limited care obligations"
-        },
-        "care_obligations": {
-            "2_hours": "Communication and updates",
-            "3_hours": "Food and beverages",
-            "8_hours": "Accommodation and transportation"
-        },
-        "canadian_airports_count": len(CANADIAN_AIRPORTS),
-        "tarmac_delay_rule": "Mandatory disembarkation after 4 hours"
-    }
+    return _static_json_response(_APPR_INFO_BYTES)
+
+def _build_response(request_id: str, validation: Tuple[bool, str, CompensationOutcome]) -> APPRValidationResponse:
+    """Wrap a validator outcome of (is_applicable, reason, compensation_result) for the API."""
+    is_applicable, reason, compensation_result = validation
+    
+    return APPRValidationResponse(
+        request_id=request_id,
+        is_appr_applicable=is_applicable,
+        appr_eligibility_reason=reason,
+        compensation_result=compensation_result.to_model()
+    )
 
 @app.post("/validate-appr", response_model=APPRValidationResponse)
 async def validate_appr(request: APPRValidationRequest):
@@ -105,45 +141,65 @@ async def validate_appr(request: APPRValidationRequest):
     compensation eligibility, amounts, and passenger rights.
     """
     try:
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
         
-        logger.info(f"Processing APPR validation request {request_id} for flight {request.flight_info.flight_number}")
+        logger.info("Processing APPR validation request %s for flight %s", request_id, request.flight_info.flight_number)
         
-        # Validate the request
-        is_applicable, reason, compensation_result = validator.validate_appr_request(request)
+        # Validate the request and create response
+        response = _build_response(request_id, validator.validate_appr_request(request))
+        compensation_result = response.compensation_result
         
-        # Create response
-        response = APPRValidationResponse(
-            request_id=request_id,
-            is_appr_applicable=is_applicable,
-            appr_eligibility_reason=reason,
-            compensation_result=compensation_result,
-            processing_timestamp=datetime.utcnow()
+        logger.info(
+            "APPR validation completed for request %s. Eligible: %s, Amount: CAD $%s",
+            request_id, compensation_result.eligible_for_compensation, compensation_result.compensation_amount
         )
         
-        logger.info(f"APPR validation completed for request {request_id}. Eligible: {compensation_result.eligible_for_compensation}, Amount: CAD ${compensation_result.compensation_amount}")
-        
         return response
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
     
     except Exception as e:
-        logger.error(f"Error processing APPR validation: {e}", exc_info=True)
+        logger.error("Error processing APPR validation: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error during validation")
 
+@app.post("/validate-appr-batch", response_model=List[APPRValidationResponse])
+async def validate_appr_batch(requests: List[APPRValidationRequest]):
+    """
+    Batch APPR validation endpoint.
+    
+    Validates several flight disruptions in one call. Responses are
+    returned in the same order as the submitted requests.
+    """
+    try:
+        responses = [_build_response(_new_request_id(), validation) for validation in validator.validate_many(requests)]
+        
+        logger.info("APPR batch validation completed for %d requests", len(responses))
+        
+        return responses
+        
+    except ValueError as e:
+        logger.error("Validation error: %s", e)
+        raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
+    
+    except Exception as e:
+        logger.error("Error processing APPR batch validation: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error during validation")
+
+_CANADIAN_AIRPORTS_BYTES = _json_bytes({
+    "airports": dict(CANADIAN_AIRPORTS),
+    "total_count": len(CANADIAN_AIRPORTS),
+    "note": "APPR applies only to flights departing from these Canadian airports"
+})
+
 @app.get("/canadian-airports")
-async def get_canadian_airports():
+async def get_canadian_airports() -> Response:
     """Get list of Canadian airports covered by APPR."""
-    return {
-        "airports": CANADIAN_AIRPORTS,
-        "total_count": len(CANADIAN_AIRPORTS),
-        "note": "APPR applies only to flights departing from these Canadian airports"
-    }
+    return _static_json_response(_CANADIAN_AIRPORTS_BYTES)
 
 @app.post("/check-airport")
-async def check_airport_eligibility(airport_code: str):
+async def check_airport_eligibility(airport_code: str) -> Dict[str, Any]:
     """Check if a specific airport code is Canadian and APPR-eligible."""
     airport_code = airport_code.upper().strip()
     
@@ -161,22 +217,25 @@ async def check_airport_eligibility(airport_code: str):
         "note": "APPR applies only to flights departing from Canadian airports"
     }
 
+_ROOT_BYTES = _json_bytes({
+    "service": "APPR Validation Engine",
+    "version": "1.0.0",
+    "description": "Air Passenger Protection Rights validation for Canadian flight disruptions",
+    "endpoints": {
+        "validate": "/validate-appr",
+        "validate_batch": "/validate-appr-batch",
+        "health": "/health",
+        "info": "/appr-info",
+        "airports": "/canadian-airports",
+        "check_airport": "/check-airport"
+    },
+    "documentation": "/docs"
+})
+
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Root endpoint with service information."""
-    return {
-        "service": "APPR Validation Engine",
-        "version": "1.0.0",
-        "description": "Air Passenger Protection Rights validation for Canadian flight disruptions",
-        "endpoints": {
-            "validate": "/validate-appr",
-            "health": "/health",
-            "info": "/appr-info",
-            "airports": "/canadian-airports",
-            "check_airport": "/check-airport"
-        },
-        "documentation": "/docs"
-    }
+    return _static_json_response(_ROOT_BYTES)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,3 +1,5 @@
+import sys
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
@@ -37,9 +39,11 @@ class FlightInfo(BaseModel):
     @field_validator('departure_airport', 'arrival_airport')
     @classmethod
     def validate_airport_codes(cls, v):
-        if len(v) != 3 or not v.isalpha():
+        # IATA codes are ASCII; str.isalpha() alone also accepts accented letters
+        if len(v) != 3 or not (v.isascii() and v.isalpha()):
             raise ValueError('Airport code must be 3 letters')
-        return v.upper()
+        # Interned codes share one object per airport and hit the identity fast path in lookups
+        return sys.intern(v.upper())
 
 
 class PassengerInfo(BaseModel):
@@ -70,6 +74,27 @@ class CompensationResult(BaseModel):
     alternative_arrangements: List[str] = Field(default_factory=list)
 
 
+@dataclass(slots=True)
+class CompensationOutcome:
+    """Mutable result built up by the validator; converted to CompensationResult for API responses."""
+    eligible_for_compensation: bool
+    compensation_amount: float = 0.0
+    care_obligations: List[str] = field(default_factory=list)
+    rebooking_rights: List[str] = field(default_factory=list)
+    refund_rights: List[str] = field(default_factory=list)
+    compliance_notes: List[str] = field(default_factory=list)
+    alternative_arrangements: List[str] = field(default_factory=list)
+    
+    @property
+    def notes_preview(self) -> str:
+        """First two compliance notes joined for one-line display."""
+        return "; ".join(self.compliance_notes[:2])
+    
+    def to_model(self) -> CompensationResult:
+        # Fields are already well-typed, so skip pydantic validation
+        return CompensationResult.model_construct(**asdict(self))
+
+
 class APPRValidationRequest(BaseModel):
     flight_info: FlightInfo
     passenger_info: PassengerInfo
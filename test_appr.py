@@ -0,0 +1,22 @@
+import pytest
+
+from appr_validator import APPRValidator
+from test_scenarios import SCENARIOS
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return APPRValidator()
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s.name)
+def test_scenario(scenario, validator):
+    """Each APPR test scenario yields its expected applicability and compensation."""
+    is_applicable, reason, result = validator.validate_appr_request(scenario.request)
+
+    assert is_applicable == scenario.appr_applicable
+    if scenario.expected_appr_applicable is not None:
+        assert is_applicable == scenario.expected_appr_applicable
+
+    assert result.eligible_for_compensation == scenario.expected_eligible
+    assert result.compensation_amount == scenario.expected_compensation